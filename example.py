@@ -3,7 +3,7 @@ from typing import List, Tuple, Any, Dict, Optional, Union
 
 from pydantic import RootModel, Field, constr, conint, BaseModel
 
-from main import generate_dummy_data
+from main import generate_dummy_data, generate_dummy_data_stream
 
 
 class UserRole(Enum):
@@ -35,6 +35,6 @@ class RootList(RootModel[List[User]]):
 # Generate dummy data for User and output to console
 print(generate_dummy_data(User))
 
-# Generate dummy data for RootList and write to JSON file
+# Generate dummy data for RootList and stream it to a JSON file
 with open("dummy_data.json", "w") as f:
-    f.write(generate_dummy_data(RootList))
+    generate_dummy_data_stream(RootList, f)
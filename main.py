@@ -1,125 +1,425 @@
 import json
+import string
 from enum import Enum
-from random import choice
+from functools import cache
+from random import choice, choices, randint, random, sample, uniform
 from types import UnionType
-from typing import Any, Type, Union, get_origin, get_args, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TextIO, Type, Union, get_origin, get_args, TypeVar
 
 from annotated_types import Interval
-from faker import Faker
 from pydantic import BaseModel, RootModel, StringConstraints
+from pydantic.fields import FieldInfo
 from typing_extensions import ParamSpec
 
-fake = Faker()
+if TYPE_CHECKING:
+    from faker import Faker
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster serializer
+    orjson = None  # type: ignore[assignment]
+
+# Character pool for generated strings
+_LETTERS = string.ascii_letters
+
+# Number of items generated for list and dict fields
+_LIST_LENGTH = 3
+_DICT_LENGTH = 2
 
 TModel = TypeVar('TModel', bound=BaseModel)
 
 
-def generate_dummy_data(model: Type[TModel]) -> str:
-    """Generate a dummy JSON string from a Pydantic v2 model, handling nested structures, lists, dicts, and constraints."""
+@cache
+def _fake() -> 'Faker':
+    """Return the shared Faker instance, importing Faker only once sentences are actually generated."""
+    from faker import Faker
+
+    return Faker()
+
+
+@cache
+def _words() -> tuple[str, ...]:
+    """Return the lorem word pool for dict keys, bare lists and Any values, loaded on first use."""
+    from faker.providers.lorem.en_US import Provider as LoremProvider
+
+    return tuple(LoremProvider.word_list)
+
+
+# Compiled generation plans: one generated function per model returning a fresh instance dict
+_PLAN_CACHE: dict[type, Callable[[], dict[str, Any]]] = {}
+
+# Deepest chain of nested models inlined into one plan, well inside the parser's limit on nested brackets
+_INLINE_MAX_DEPTH = 64
+
+# Widest model built with a dict display; CPython assembles wider displays in chunks and resizes as it merges them
+_DISPLAY_MAX_FIELDS = 16
+
+# Compiled value generators, keyed by field type and its frozen constraint metadata
+_GENERATOR_CACHE: dict[tuple[Any, frozenset[tuple[str, Any]]], Callable[[], Any]] = {}
+
+# Bound attributes read from annotated_types.Interval constraints
+_INTERVAL_BOUNDS = ('gt', 'ge', 'lt', 'le')
+
+
+def extract_metadata(metadata: list[Any]) -> dict[str, Any]:
+    """Extracts constraint metadata from Pydantic v2 FieldInfo metadata list."""
+    extracted: dict[str, Any] = {}
+    for item in metadata:
+        if isinstance(item, StringConstraints):
+            extracted.update({k: v for k, v in item.__dict__.items() if v is not None})
+        elif isinstance(item, Interval):
+            extracted.update({k: v for k in _INTERVAL_BOUNDS if (v := getattr(item, k, None)) is not None})
+
+    return extracted
+
+
+def _compile_union(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile Optional[X] (Union[X, None]) to a generator that returns None half of the time."""
+    if type(None) not in args:
+        return lambda: None
+
+    non_none_type = next(t for t in args if t is not type(None))
+    inner = _generator_for(non_none_type, metadata)
+    return lambda: None if random() < 0.5 else inner()
+
+
+def _int_bounds(metadata: dict[str, Any]) -> tuple[int, int]:
+    """Resolve inclusive int bounds from ge/gt and le/lt constraints."""
+    min_val = metadata.get("ge", metadata.get("gt", 1) + 1)
+    max_val = metadata.get("le", metadata.get("lt", 1000) - 1)
+    return min_val, max_val
+
+
+def _float_bounds(metadata: dict[str, Any]) -> tuple[float, float]:
+    """Resolve float bounds from ge/gt and le/lt constraints."""
+    min_val = metadata.get("ge", metadata.get("gt", 1.0) + 0.1)
+    max_val = metadata.get("le", metadata.get("lt", 1000.0) - 0.1)
+    return min_val, max_val
+
+
+def _batch_bool(metadata: dict[str, Any]) -> Callable[[int], list[Any]]:
+    """Compile a sampler of k booleans."""
+    return lambda k: choices((True, False), k=k)
+
+
+def _batch_int(metadata: dict[str, Any]) -> Callable[[int], list[Any]]:
+    """Compile a sampler of k ints within the constrained bounds."""
+    min_val, max_val = _int_bounds(metadata)
+    values = range(min_val, max_val + 1)
+    return lambda k: choices(values, k=k)
+
+
+def _batch_float(metadata: dict[str, Any]) -> Callable[[int], list[Any]]:
+    """Compile a sampler of k floats within the constrained bounds, rounded to two places."""
+    min_val, max_val = _float_bounds(metadata)
+    return lambda k: [round(uniform(min_val, max_val), 2) for _ in range(k)]
+
+
+# Samplers producing a whole homogeneous collection of primitives in one call
+_BATCH_HANDLERS: dict[Any, Callable[[dict[str, Any]], Callable[[int], list[Any]]]] = {
+    bool: _batch_bool,
+    int: _batch_int,
+    float: _batch_float,
+}
+
+
+def _compile_list(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a list type to a generator of _LIST_LENGTH items."""
+    if not args:
+        words = _words()
+        return lambda: choices(words, k=_LIST_LENGTH)
+
+    batch = _BATCH_HANDLERS.get(args[0])
+    if batch is not None:
+        sample_values = batch(metadata)
+        return lambda: sample_values(_LIST_LENGTH)
+
+    item = _generator_for(args[0], metadata)
+    return lambda: [item() for _ in range(_LIST_LENGTH)]
+
+
+def _compile_dict(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a dict type to a generator of _DICT_LENGTH entries keyed by distinct words."""
+    key_type, value_type = args if args else (str, Any)
+    value = _generator_for(value_type, metadata)
+    words = _words()
+    return lambda: {key: value() for key in sample(words, _DICT_LENGTH)}
+
+
+def _compile_tuple(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a fixed-length tuple type to a generator of one value per element type."""
+    batch = _BATCH_HANDLERS.get(args[0]) if args and all(t is args[0] for t in args) else None
+    if batch is not None:
+        sample_values = batch(metadata)
+        size = len(args)
+        return lambda: tuple(sample_values(size))
+
+    items = tuple(_generator_for(t, metadata) for t in args)
+    return lambda: tuple(item() for item in items)
+
+
+def _compile_bool(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a bool type to a coin-flip generator."""
+    return lambda: random() < 0.5
+
+
+def _compile_int(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile an int type to a generator within its ge/gt and le/lt bounds."""
+    min_val, max_val = _int_bounds(metadata)
+    return lambda: randint(min_val, max_val)
+
 
-    def extract_metadata(metadata: list[Any]) -> dict:
-        """Extracts constraint metadata from Pydantic v2 FieldInfo metadata list."""
-        extracted: dict = {}
-        for item in metadata:
-            if isinstance(item, StringConstraints):
-                extracted.update(item.__dict__)
-            elif isinstance(item, Interval):
-                for attr in ['gt', 'ge', 'lt', 'le']:
-                    if hasattr(item, attr):
-                        extracted[attr] = getattr(item, attr)
+def _compile_float(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a float type to a generator within its ge/gt and le/lt bounds."""
+    min_val, max_val = _float_bounds(metadata)
+    return lambda: round(uniform(min_val, max_val), 2)
 
-        extracted = {k: v for k, v in extracted.items() if v is not None}
-        return extracted
 
-    def generate_value(field_type: Any, metadata: dict) -> Any:
-        """Generate a dummy value based on the field type, applying constraints where possible."""
+def _compile_str(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile a str type to a generator of random letters honouring min_length and max_length."""
+    # Defaults widen around a single given bound so the range is never empty; a lone minimum gets some slack above it
+    max_length = metadata.get("max_length", max(15, metadata.get("min_length", 0) + 10))
+    min_length = metadata.get("min_length", min(5, max_length))
 
-        origin: ParamSpec | Type[UnionType] | type | None = get_origin(field_type)
-        args: tuple[Any, ...] = get_args(field_type)
+    if min_length == max_length:
+        return lambda: ''.join(choices(_LETTERS, k=min_length))
 
-        # Handle Optional[X] (Union[X, None])
-        if origin is Union and type(None) in args:
-            non_none_type = next(t for t in args if t is not type(None))
-            return choice([None, generate_value(non_none_type, metadata)])
+    return lambda: ''.join(choices(_LETTERS, k=randint(min_length, max_length)))
+
+
+def _compile_any(field_type: Any, args: tuple[Any, ...], metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Compile Any to a generator of a random word, int, float or sentence."""
+    min_float, max_float = _float_bounds({})
+    words = _words()
+    generators = (
+        lambda: choice(words),
+        lambda: randint(1, 1000),
+        lambda: round(uniform(min_float, max_float), 2),
+        lambda: _fake().sentence(nb_words=4),
+    )
+    # Pick the kind of value first so only one of them is generated per call
+    return lambda: choice(generators)()
+
+
+# Generator compilers keyed by type origin (or the bare type for non-generic annotations)
+_HANDLERS: dict[Any, Callable[[Any, tuple[Any, ...], dict[str, Any]], Callable[[], Any]]] = {
+    Union: _compile_union,
+    UnionType: _compile_union,
+    list: _compile_list,
+    dict: _compile_dict,
+    tuple: _compile_tuple,
+    bool: _compile_bool,
+    int: _compile_int,
+    float: _compile_float,
+    str: _compile_str,
+    Any: _compile_any,
+}
+
+# Type kinds, resolved once per class so dispatch compares a tag instead of walking the MRO
+_KIND_PRIMITIVE = 0
+_KIND_ENUM = 1
+_KIND_MODEL = 2
+_KIND_ROOT = 3
+
+# Memoized kinds per class; the plan and generator caches keep these classes alive anyway
+_KIND_CACHE: dict[type, int] = {}
+
+
+def _kind_of(field_type: Any) -> int:
+    """Classify a type as a root model, model, Enum or anything else, memoized per class."""
+    if not isinstance(field_type, type):
+        return _KIND_PRIMITIVE
+
+    kind = _KIND_CACHE.get(field_type)
+    if kind is None:
+        if issubclass(field_type, RootModel):
+            kind = _KIND_ROOT
+        elif issubclass(field_type, BaseModel):
+            kind = _KIND_MODEL
+        elif issubclass(field_type, Enum):
+            kind = _KIND_ENUM
+        else:
+            kind = _KIND_PRIMITIVE
+        _KIND_CACHE[field_type] = kind
+    return kind
+
+
+def _compile_generator(field_type: Any, metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Resolve a field type and its constraints into a zero-argument dummy value generator."""
+
+    origin: ParamSpec | Type[UnionType] | type | None = get_origin(field_type)
+    args: tuple[Any, ...] = get_args(field_type)
+
+    handler = _HANDLERS.get(origin or field_type)
+    if handler is None:
+        kind = _kind_of(field_type)
 
         # Handle Root Models
-        if isinstance(field_type, type) and issubclass(field_type, RootModel):
+        if kind == _KIND_ROOT:
             root_type: object = field_type.__annotations__.get('root', Any)
-            return generate_value(root_type, metadata)
+            return _generator_for(root_type, metadata)
 
-        # Handle nested Pydantic models
-        if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-            return generate_dummy_instance(field_type)
+        # Handle nested Pydantic models; resolved at call time so self-referencing models still compile
+        if kind == _KIND_MODEL:
+            return lambda: _plan_for(field_type)()
 
-        # Handle Enums
-        if isinstance(field_type, type) and issubclass(field_type, Enum):
-            return choice(list(field_type)).value
+        # Handle Enums, materializing member values once rather than on every call
+        if kind == _KIND_ENUM:
+            values = tuple(member.value for member in field_type)
+            return lambda: choice(values)
 
-        # Handle Lists
-        if origin is list:
-            sub_type: object = args[0] if args else Any
-            return [generate_value(sub_type, metadata) for _ in range(3)]
+        # Subclasses of primitive types use the handler of their nearest handled base class
+        if isinstance(field_type, type):
+            handler = next((_HANDLERS[base] for base in field_type.__mro__ if base in _HANDLERS), None)
 
-        # Handle Dicts
-        if origin is dict:
-            key_type, value_type = args if args else (str, Any)
-            return {fake.word(): generate_value(value_type, metadata) for _ in range(2)}
+    if handler is None:
+        return lambda: None
+    return handler(field_type, args, metadata)
 
-        # Handle Tuples
-        if origin is tuple:
-            return tuple(generate_value(t, metadata) for t in args)
 
-        # Handle primitive types with explicit check for bool first
-        if field_type is bool or (isinstance(field_type, type) and issubclass(field_type, bool)):
-            return fake.boolean()
+def _generator_for(field_type: Any, metadata: dict[str, Any]) -> Callable[[], Any]:
+    """Return the cached generator for a field type and its constraints, compiling it on first use."""
+    try:
+        key = (field_type, frozenset(metadata.items()))
+        generator = _GENERATOR_CACHE.get(key)
+    except TypeError:
+        # Unhashable types or constraints cannot be cached; compile them on every use
+        return _compile_generator(field_type, metadata)
 
-        # Handle constrained types
-        if isinstance(field_type, type):
-            if issubclass(field_type, int):
-                min_val = metadata.get("ge", metadata.get("gt", 1) + 1)
-                max_val = metadata.get("le", metadata.get("lt", 1000) - 1)
-                return fake.random_int(min=min_val, max=max_val)
-            elif issubclass(field_type, float):
-                min_val = metadata.get("ge", metadata.get("gt", 1.0) + 0.1)
-                max_val = metadata.get("le", metadata.get("lt", 1000.0) - 0.1)
-                return round(fake.pyfloat(min_value=min_val, max_value=max_val), 2)
-            elif issubclass(field_type, str):
-                min_length = metadata.get("min_length", 5)
-                max_length = metadata.get("max_length", 15)
-
-                if min_length == max_length:
-                    return fake.pystr(min_chars=min_length, max_chars=min_length)
-
-                return fake.text(max_nb_chars=max_length)[:max(min_length, max_length)]
-
-        # Default fallback
-        if field_type is str:
-            return fake.sentence(nb_words=4)
-        elif field_type is int:
-            return fake.random_int(min=1, max=1000)
-        elif field_type is float:
-            return round(fake.pyfloat(), 2)
-        elif field_type is list:
-            return [fake.word() for _ in range(3)]
-        # Handle Any type
-        elif field_type is Any:
-            return choice([fake.word(), fake.random_int(min=1, max=1000), fake.pyfloat(), fake.sentence(nb_words=4)])
+    if generator is None:
+        generator = _GENERATOR_CACHE[key] = _compile_generator(field_type, metadata)
+    return generator
+
+
+def generate_value(field_type: Any, metadata: dict[str, Any]) -> Any:
+    """Generate a dummy value based on the field type, applying constraints where possible."""
+    return _generator_for(field_type, metadata)()
+
+
+def _entries_source(entries: list[tuple[str, str]], namespace: dict[str, Any], lines: list[str]) -> str:
+    """Emit an expression building a dict from (key, value expression) entries."""
+    if len(entries) <= _DISPLAY_MAX_FIELDS:
+        return '{' + ', '.join(f'{key!r}: {expression}' for key, expression in entries) + '}'
+
+    # Wide models fill a copy of a presized template, which dict.copy() clones without any resizing
+    index = len(namespace)
+    namespace[f'_t{index}'] = dict.fromkeys(key for key, _ in entries)
+    lines.append(f'_d{index} = _t{index}.copy()')
+    lines.extend(f'_d{index}[{key!r}] = {expression}' for key, expression in entries)
+    return f'_d{index}'
+
+
+def _model_source(model: Type[BaseModel], namespace: dict[str, Any], lines: list[str]) -> str:
+    """Emit an expression building one instance of a model, binding its generators into namespace."""
+
+    # Nested models are inlined depth-first with an explicit stack, so deep schemas never hit the recursion limit.
+    # Each frame holds the models on the path ending at the one being emitted, its remaining fields and its entries.
+    stack: list[tuple[tuple[type, ...], Iterator[tuple[str, FieldInfo]], list[tuple[str, str]]]] = [
+        ((model,), iter(model.model_fields.items()), [])
+    ]
+    expression = ''
+    while stack:
+        path, fields, entries = stack[-1]
+        for field_name, field_info in fields:
+            field_type: Any = field_info.annotation
+
+            # Descend into nested models; self-referencing or too deeply nested models fall back to a generator call
+            if _kind_of(field_type) == _KIND_MODEL and field_type not in path and len(path) < _INLINE_MAX_DEPTH:
+                entries.append((field_name, ''))
+                stack.append((path + (field_type,), iter(field_type.model_fields.items()), []))
+                break
 
+            name = f'_f{len(namespace)}'
+            namespace[name] = _generator_for(field_type, extract_metadata(field_info.metadata))
+            entries.append((field_name, f'{name}()'))
+        else:
+            # All fields emitted: build this model's expression and hand it to the parent's pending entry
+            stack.pop()
+            expression = _entries_source(entries, namespace, lines)
+            if stack:
+                parent_entries = stack[-1][2]
+                parent_entries[-1] = (parent_entries[-1][0], expression)
+
+    return expression
+
+
+def _compile_plan(model: Type[TModel]) -> Callable[[], dict[str, Any]]:
+    """Compile a model into one straight-line function that calls every field generator."""
+    namespace: dict[str, Any] = {}
+    lines: list[str] = []
+    expression = _model_source(model, namespace, lines)
+    lines.append(f'return {expression}')
+
+    source = 'def build():\n' + ''.join(f'    {line}\n' for line in lines)
+    exec(compile(source, f'<dummy plan for {model.__qualname__}>', 'exec'), namespace)
+    return namespace['build']
+
+
+def _plan_for(model: type) -> Callable[[], dict[str, Any]]:
+    """Return the cached plan for a model, compiling it on first use."""
+    plan = _PLAN_CACHE.get(model)
+    if plan is None:
+        plan = _PLAN_CACHE[model] = _compile_plan(model)
+    return plan
+
+
+def generate_dummy_instance(model: Type[TModel]) -> Any:
+    """Generate a dummy instance of a Pydantic v2 model."""
+
+    # Handle Root Models in Pydantic v2; their generator resolves the root type once and is cached
+    if _kind_of(model) == _KIND_ROOT:
+        return generate_value(model, {})
+
+    return _plan_for(model)()
+
+
+def _root_list_item_generator(model: Type[TModel]) -> Callable[[], Any] | None:
+    """Return the item generator of a RootModel[List[X]], or None for any other model."""
+    if _kind_of(model) != _KIND_ROOT:
         return None
 
-    def generate_dummy_instance(model: Type[TModel]) -> Any:
-        """Generate a dummy instance of a Pydantic v2 model."""
+    root_type: object = model.__annotations__.get('root', Any)
+    if get_origin(root_type) is not list:
+        return None
+
+    args: tuple[Any, ...] = get_args(root_type)
+    return _generator_for(args[0] if args else Any, {})
+
 
-        # Handle Root Models in Pydantic v2
-        if issubclass(model, RootModel):
-            root_type: object = model.__annotations__.get('root', Any)
-            return generate_value(root_type, {})
+def _dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize a generated instance to a JSON string, preferring orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects values it cannot encode natively, such as ints beyond 64 bits
+            pass
 
-        return {
-            field_name: generate_value(field_info.annotation, extract_metadata(field_info.metadata))
-            for field_name, field_info in model.model_fields.items()
-        }
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def generate_dummy_data(model: Type[TModel]) -> str:
+    """Generate a dummy JSON string from a Pydantic v2 model, handling nested structures, lists, dicts, and constraints."""
 
     # Create the dummy instance and return as JSON string
     dummy_instance: Any = generate_dummy_instance(model)
-    return json.dumps(dummy_instance, indent=4)
+    return _dumps(dummy_instance)
+
+
+def generate_dummy_data_stream(model: Type[TModel], fp: TextIO) -> None:
+    """Write compact dummy JSON for a Pydantic v2 model to a text file, streaming root list items one at a time."""
+
+    # Only root lists are streamed; any other model is small enough to serialize in one piece
+    item_generator = _root_list_item_generator(model)
+    if item_generator is None:
+        fp.write(_dumps(generate_dummy_instance(model), indent=False))
+        return
+
+    fp.write('[')
+    for index in range(_LIST_LENGTH):
+        if index:
+            fp.write(',')
+        fp.write(_dumps(item_generator(), indent=False))
+    fp.write(']')
@@ -1,11 +1,15 @@
+import io
 import json
+import os
+import subprocess
+import sys
 from enum import Enum
 from typing import List, Dict, Any, Union, Tuple, Optional
 
 import pytest
-from pydantic import BaseModel, RootModel, conint, constr, Field
+from pydantic import BaseModel, RootModel, conint, constr, create_model, Field
 
-from main import generate_dummy_data
+from main import generate_dummy_data, generate_dummy_data_stream
 
 
 class UserRole(Enum):
@@ -49,6 +53,16 @@ class EmptyModel(BaseModel):
     pass
 
 
+class HugeIntModel(BaseModel):
+    x: conint(ge=10**20, le=10**21)
+
+
+class LengthBounds(BaseModel):
+    narrow: constr(min_length=12, max_length=15)
+    min_only: constr(min_length=20)
+    max_only: constr(max_length=3)
+
+
 class StrictConstraints(BaseModel):
     exact_length: constr(min_length=10, max_length=10)
     exact_value: conint(ge=42, le=42)
@@ -68,6 +82,23 @@ class AnyModel(BaseModel):
     mixed_field: Any
 
 
+class PipeOptionalModel(BaseModel):
+    maybe_count: int | None
+
+
+class TreeNode(BaseModel):
+    value: int
+    child: Optional["TreeNode"] = None
+
+
+WideModel = create_model("WideModel", **{f"field_{i}": (conint(ge=1, le=9), ...) for i in range(20)})
+
+
+class WideContainer(BaseModel):
+    wide: WideModel
+    label: str
+
+
 @pytest.mark.unit
 def test_generates_valid_json():
     result = generate_dummy_data(SimpleModel)
@@ -92,6 +123,25 @@ def test_respects_string_constraints():
     assert 5 <= len(result["name"]) <= 15
 
 
+@pytest.mark.unit
+def test_serializes_ints_beyond_64_bits():
+    result = json.loads(generate_dummy_data(HugeIntModel))
+    assert 10**20 <= result["x"] <= 10**21
+
+    buffer = io.StringIO()
+    generate_dummy_data_stream(HugeIntModel, buffer)
+    assert 10**20 <= json.loads(buffer.getvalue())["x"] <= 10**21
+
+
+@pytest.mark.unit
+def test_respects_string_length_bounds():
+    for _ in range(20):
+        result = json.loads(generate_dummy_data(LengthBounds))
+        assert 12 <= len(result["narrow"]) <= 15
+        assert 20 <= len(result["min_only"]) <= 30
+        assert 1 <= len(result["max_only"]) <= 3
+
+
 @pytest.mark.unit
 def test_handles_exact_constraints():
     result = json.loads(generate_dummy_data(StrictConstraints))
@@ -187,3 +237,65 @@ def test_handles_any():
     results = [json.loads(generate_dummy_data(AnyModel)) for _ in range(10)]
     types_found = {type(r["mixed_field"]) for r in results}
     assert len(types_found) >= 1
+
+
+@pytest.mark.unit
+def test_handles_pipe_optional():
+    results = [json.loads(generate_dummy_data(PipeOptionalModel)) for _ in range(10)]
+    assert all(r["maybe_count"] is None or isinstance(r["maybe_count"], int) for r in results)
+
+
+@pytest.mark.unit
+def test_streams_root_list_model():
+    buffer = io.StringIO()
+    generate_dummy_data_stream(RootList, buffer)
+    value = json.loads(buffer.getvalue())
+    assert isinstance(value, list)
+    assert len(value) == 3
+    assert all(100 <= user["id"] <= 999 for user in value)
+
+
+@pytest.mark.unit
+def test_streams_regular_model():
+    buffer = io.StringIO()
+    generate_dummy_data_stream(User, buffer)
+    value = json.loads(buffer.getvalue())
+    assert isinstance(value["address"], dict)
+    assert value["role"] in [role.value for role in UserRole]
+
+
+@pytest.mark.unit
+def test_handles_self_referencing_model():
+    result = json.loads(generate_dummy_data(TreeNode))
+    while result is not None:
+        assert isinstance(result["value"], int)
+        result = result["child"]
+
+
+@pytest.mark.unit
+def test_handles_wide_models():
+    results = [json.loads(generate_dummy_data(WideContainer)) for _ in range(3)]
+    for result in results:
+        assert list(result["wide"].keys()) == [f"field_{i}" for i in range(20)]
+        assert all(1 <= value <= 9 for value in result["wide"].values())
+        assert isinstance(result["label"], str)
+
+
+@pytest.mark.unit
+def test_handles_long_nesting_chains():
+    model = create_model("Level0", value=(int, ...))
+    for level in range(1, 100):
+        model = create_model(f"Level{level}", value=(int, ...), child=(model, ...))
+
+    result = json.loads(generate_dummy_data(model))
+    depth = 0
+    while "child" in result:
+        result = result["child"]
+        depth += 1
+    assert depth == 99
+
+
+@pytest.mark.unit
+def test_import_does_not_load_faker():
+    code = "import sys, main; assert 'faker' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))